@@ -3,29 +3,442 @@ PDF Universal Data Extractor
 Main extraction pipeline with multi-engine fallback strategy
 """
 
+import functools
+import importlib
 import json
 import logging
+import math
+import mmap
+import os
+import re
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
-# PDF processing libraries
-import pdfplumber
-try:
-    from docling.document_converter import DocumentConverter
-    DOCLING_AVAILABLE = True
-except ImportError:
-    DOCLING_AVAILABLE = False
-    logging.warning("docling not available, falling back to other engines")
+import numpy as np
 
 try:
-    import pytesseract
-    from PIL import Image
-    TESSERACT_AVAILABLE = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    TESSERACT_AVAILABLE = False
-    logging.warning("pytesseract not available, OCR features disabled")
+    HAS_ORJSON = False
+
+# PDF processing libraries are imported on first use: docling alone pulls in
+# torch/transformers, and most calls only ever touch one engine
+_engine_cache: Dict[str, Any] = {}
+
+
+def _load_engine(name: str, loader: Callable[[], Any]) -> Any:
+    """
+    Import an engine once and cache it (including a failed import)
+    Raises ImportError so callers fall through to the next engine
+    """
+    if name not in _engine_cache:
+        try:
+            _engine_cache[name] = loader()
+        except ImportError as e:
+            logging.warning(f"{name} not available: {e}")
+            _engine_cache[name] = None
+    
+    engine = _engine_cache[name]
+    if engine is None:
+        raise ImportError(f"{name} not available")
+    return engine
+
+
+def _get_pdfplumber():
+    """pdfplumber module"""
+    return _load_engine("pdfplumber", lambda: importlib.import_module("pdfplumber"))
+
+
+def _get_docling():
+    """docling DocumentConverter class"""
+    return _load_engine(
+        "docling",
+        lambda: importlib.import_module("docling.document_converter").DocumentConverter
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_converter():
+    """
+    Shared docling DocumentConverter (one per process)
+    Construction loads model weights and pipeline configs, which costs more
+    than converting a small PDF
+    """
+    DocumentConverter = _get_docling()
+    return DocumentConverter()
+
+
+def _get_pymupdf():
+    """PyMuPDF module"""
+    def _import():
+        try:
+            pymupdf = importlib.import_module("pymupdf")
+        except ImportError:
+            # PyMuPDF < 1.24.3 only provides the (now deprecated) fitz name
+            return importlib.import_module("fitz")
+        # Newer releases print a pymupdf_layout hint to stdout, which would
+        # end up in the CLI's JSON dump
+        if hasattr(pymupdf, "no_recommend_layout"):
+            pymupdf.no_recommend_layout()
+        return pymupdf
+    return _load_engine("pymupdf", _import)
+
+
+def _get_pdfium():
+    """pypdfium2 module"""
+    return _load_engine("pypdfium2", lambda: importlib.import_module("pypdfium2"))
+
+
+def _get_hyperscan():
+    """hyperscan module"""
+    return _load_engine("hyperscan", lambda: importlib.import_module("hyperscan"))
+
+
+def _get_pyarrow():
+    """pyarrow module"""
+    return _load_engine("pyarrow", lambda: importlib.import_module("pyarrow"))
+
+
+def _get_pytesseract():
+    """pytesseract module (requires Pillow for page images)"""
+    def _import():
+        import PIL.Image  # noqa: F401
+        import pytesseract
+        return pytesseract
+    return _load_engine("pytesseract", _import)
+
+
+@contextmanager
+def _open_pdf_mmap(file_path: str):
+    """
+    Open a PDF with pdfplumber over a read-only mmap of the file
+    xref lookups jump around the file; with mmap the kernel pages these
+    in directly instead of going through buffered Python reads
+    """
+    pdfplumber = _get_pdfplumber()
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # pdfplumber leaves external streams open, so mm is closed here
+            with pdfplumber.open(mm) as pdf:
+                yield pdf
+
+
+# Parallel page extraction settings
+MAX_WORKERS = 8
+MIN_PAGES_FOR_PARALLEL = 4  # below this, process startup outweighs the gain
+MAX_PAGES_PER_CHUNK = 10
+
+
+def _get_max_workers() -> int:
+    """Number of worker processes for page-level extraction"""
+    return min(os.cpu_count() or 1, MAX_WORKERS)
+
+
+def _chunk_pages(total_pages: int, workers: int) -> List[List[int]]:
+    """
+    Split page indices into blocks for worker processes
+    One task per page pays process IPC/pickling and font loading for every
+    page and makes workers contend on the queue; blocks of pages amortize
+    that cost while keeping per-worker memory bounded.
+    """
+    chunk_size = max(1, math.ceil(total_pages / (workers * 2)))
+    chunk_size = min(chunk_size, MAX_PAGES_PER_CHUNK)
+    return [
+        list(range(start, min(start + chunk_size, total_pages)))
+        for start in range(0, total_pages, chunk_size)
+    ]
+
+
+def _extract_page_content(page_index: int, page, text: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Extract text and tables from a single pdfplumber page
+    text: already extracted page text (e.g. from analysis sampling) to reuse
+    """
+    if text is None:
+        text = page.extract_text() or ""
+    return {
+        "page_index": page_index,
+        "text": text,
+        "tables": page.extract_tables() or []
+    }
+
+
+def _extract_pages(indexed_pages, sampled_texts: Dict[int, str]) -> Iterator[Dict[str, Any]]:
+    """Extract (page_index, page) pairs in order, yielding each page result"""
+    for i, page in indexed_pages:
+        yield _extract_page_content(i, page, sampled_texts.get(i))
+
+
+def _extract_chunk(args: Tuple[str, List[int], Dict[int, str]]) -> List[Dict[str, Any]]:
+    """
+    Extract a block of pages (runs in a worker process)
+    Each worker opens its own handle since pdfplumber objects are not picklable
+    """
+    pdf_path, page_indices, sampled_texts = args
+    # pdfplumber page numbers are 1-based
+    pdfplumber = _get_pdfplumber()
+    with pdfplumber.open(pdf_path, pages=[i + 1 for i in page_indices]) as pdf:
+        return list(_extract_pages(zip(page_indices, pdf.pages), sampled_texts))
+
+
+def _page_record(page_result: Dict[str, Any]) -> "PageContent":
+    """Standardized content["pages"] entry for an extracted page"""
+    return PageContent(page_num=page_result["page_index"] + 1, text=page_result["text"])
+
+
+def _table_records(page_result: Dict[str, Any]) -> List["TableContent"]:
+    """Standardized content["tables"] entries for an extracted page"""
+    return [
+        TableContent.from_rows(page_result["page_index"] + 1, j, table)
+        for j, table in enumerate(page_result["tables"])
+    ]
+
+
+def _pdfplumber_result(page_texts: List[str], tables: List["TableContent"],
+                       pages: List["PageContent"]) -> Dict[str, Any]:
+    """
+    pdfplumber engine result from per-page texts and tables
+    Shared by the in-memory and streaming paths so their output stays identical;
+    total_pages counts page_texts since pages may be written elsewhere
+    """
+    # Join once instead of repeated += (quadratic in total text size)
+    raw_text = "\n".join(page_texts) + "\n" if page_texts else ""
+    
+    return {
+        "content": {
+            "raw_text": raw_text,
+            "pages": pages,
+            "tables": tables,
+            "images": []
+        },
+        "metadata": {
+            "total_pages": len(page_texts),
+            "text_extraction_method": "native"
+        },
+        "confidence": 0.8 if raw_text.strip() else 0.3
+    }
+
+
+# OCR settings
+OCR_DPI = 200
+OCR_LANGUAGE = "eng"
+
+
+def _ocr_block(args: Tuple[str, List[int]]) -> List[Dict[str, Any]]:
+    """
+    Render and OCR a block of pages (runs in a worker process)
+    The PDF is reopened here since pdfium documents are not picklable
+    """
+    pdf_path, page_indices = args
+    pdfium = _get_pdfium()
+    pytesseract = _get_pytesseract()
+    
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_results = []
+        for i in page_indices:
+            page = pdf[i]
+            try:
+                image = page.render(scale=OCR_DPI / 72).to_pil()
+            finally:
+                page.close()
+            page_results.append({
+                "page_index": i,
+                "text": pytesseract.image_to_string(image, lang=OCR_LANGUAGE)
+            })
+        return page_results
+    finally:
+        pdf.close()
+
+
+# Pages with fewer stripped characters than this are treated as scanned
+SCAN_TEXT_THRESHOLD = 50
+
+
+def _classify_lengths(lengths: np.ndarray) -> Tuple[bool, np.ndarray]:
+    """
+    Classify sampled pages by stripped text length
+    Returns (has_text, indices of likely scanned pages)
+    """
+    return bool((lengths > 0).any()), np.nonzero(lengths < SCAN_TEXT_THRESHOLD)[0]
+
+
+# Metadata entities scanned from extracted text. Patterns must stay within
+# the syntax hyperscan supports (no backreferences or lookaround)
+METADATA_PATTERNS: Dict[str, bytes] = {
+    "date": rb"\b(19|20)\d{2}[./-]\d{1,2}[./-]\d{1,2}\b",
+    "year": rb"\b(19|20)\d{2}\b",
+    "percentage": rb"\d+(\.\d+)?\s?%",
+    "doi": rb"\b10\.\d{4,9}/[-._;()/:A-Za-z0-9]+",
+    "email": rb"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
+    "url": rb"https?://[^\s<>\"]+",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_patterns(patterns: Tuple[bytes, ...]):
+    """Compile patterns into a hyperscan block-mode database (once per set)"""
+    hyperscan = _get_hyperscan()
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=list(patterns),
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns)
+    )
+    return db
+
+
+def _scan_patterns(text: Union[str, bytes], patterns: List[bytes]) -> List[Tuple[int, int, int]]:
+    """
+    Scan UTF-8 encoded text for all patterns in a single pass
+    Returns non-overlapping (pattern_id, start, end) byte offsets, keeping the
+    longest match at each start; uses re when hyperscan is not installed
+    """
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
+    
+    try:
+        db = _compile_patterns(tuple(patterns))
+    except ImportError:
+        matches = [
+            (pattern_id, match.start(), match.end())
+            for pattern_id, pattern in enumerate(patterns)
+            for match in re.finditer(pattern, data)
+        ]
+    else:
+        matches = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matches.append((pattern_id, start, end))
+        
+        db.scan(data, match_event_handler=on_match)
+    
+    # hyperscan reports every match end, so collapse to leftmost-longest
+    results = []
+    last_end: Dict[int, int] = {}
+    for pattern_id, start, end in sorted(matches, key=lambda m: (m[0], m[1], -m[2])):
+        if start >= last_end.get(pattern_id, -1) and end > start:
+            results.append((pattern_id, start, end))
+            last_end[pattern_id] = end
+    return results
+
+
+def _byte_to_char_offsets(data: bytes, offsets: List[int]) -> Dict[int, int]:
+    """
+    Map UTF-8 byte offsets in data to character offsets in the decoded text
+    Walks the sorted offsets once, decoding only the gap since the last one
+    """
+    mapping: Dict[int, int] = {}
+    byte_pos = char_pos = 0
+    for offset in sorted(set(offsets)):
+        char_pos += len(data[byte_pos:offset].decode("utf-8", errors="surrogatepass"))
+        byte_pos = offset
+        mapping[offset] = char_pos
+    return mapping
+
+
+def _scan_entities(text: str) -> List[Dict[str, Any]]:
+    """
+    Metadata entities (dates, years, metrics, identifiers) found in text
+    start/end are character offsets into text, so text[start:end] is the match
+    """
+    names = list(METADATA_PATTERNS)
+    # surrogatepass keeps lone surrogates as one character each, so the
+    # byte-to-character offset mapping stays one-to-one
+    data = text.encode("utf-8", errors="surrogatepass")
+    matches = _scan_patterns(data, list(METADATA_PATTERNS.values()))
+    
+    char_offsets = _byte_to_char_offsets(
+        data, [offset for _, start, end in matches for offset in (start, end)]
+    )
+    entities = []
+    for pattern_id, start, end in matches:
+        char_start, char_end = char_offsets[start], char_offsets[end]
+        entities.append({
+            "type": names[pattern_id],
+            "text": text[char_start:char_end],
+            "start": char_start,
+            "end": char_end
+        })
+    return entities
+
+
+@dataclass(slots=True)
+class PageContent:
+    """Per-page entry of content["pages"]"""
+    page_num: int
+    text: str
+    tables: List[Any] = field(default_factory=list)
+    images: List[Any] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON serialization"""
+        return {
+            "page_num": self.page_num,
+            "text": self.text,
+            "tables": self.tables,
+            "images": self.images
+        }
+
+
+@dataclass(slots=True)
+class TableContent:
+    """
+    Entry of content["tables"]
+    Rectangular tables are kept as a columnar Arrow table (col_0..col_n) when
+    pyarrow is installed; ragged or empty tables, or any table without
+    pyarrow, keep the nested row lists the engine returned. Either way
+    data / to_dict() give back exactly the original rows
+    """
+    page: int
+    table_id: int
+    arrow: Any = None
+    rows: Optional[List[List[Any]]] = None
+    
+    @classmethod
+    def from_rows(cls, page: int, table_id: int, rows: List[List[Any]]) -> "TableContent":
+        """Build from engine row lists, converting to Arrow columns when lossless"""
+        try:
+            pa = _get_pyarrow()
+        except ImportError:
+            return cls(page, table_id, rows=rows)
+        
+        # Only rectangular tables round-trip through columns unchanged; ragged
+        # or cell-less rows would be padded or dropped, so keep them as rows
+        widths = {len(row) for row in rows}
+        if len(widths) != 1 or 0 in widths:
+            return cls(page, table_id, rows=rows)
+        
+        try:
+            columns = {
+                f"col_{i}": pa.array([row[i] for row in rows])
+                for i in range(widths.pop())
+            }
+            return cls(page, table_id, arrow=pa.table(columns))
+        except Exception as e:
+            logging.warning(f"Arrow conversion failed for table {table_id} on page {page}: {e}")
+            return cls(page, table_id, rows=rows)
+    
+    @property
+    def data(self) -> List[List[Any]]:
+        """Cells as row lists"""
+        if self.arrow is None:
+            return self.rows
+        return [list(row) for row in zip(*self.arrow.to_pydict().values())]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON serialization (rows are rebuilt only here)"""
+        return {
+            "page": self.page,
+            "table_id": self.table_id,
+            "data": self.data
+        }
 
 
 @dataclass
@@ -36,56 +449,52 @@ class ExtractionResult:
     metadata: Dict[str, Any]
 
 
+def _result_to_dict(result: ExtractionResult) -> Dict[str, Any]:
+    """Convert an ExtractionResult to a dictionary for JSON serialization"""
+    return {
+        "extraction_info": result.extraction_info,
+        "content": result.content,
+        "metadata": result.metadata
+    }
+
+
+# Analysis results keyed by (resolved path, mtime, size), most recent last
+ANALYSIS_CACHE_SIZE = 128
+_analysis_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
+
 class PDFAnalyzer:
     """Analyze PDF to determine processing strategy"""
     
     @staticmethod
-    def analyze_pdf(file_path: str) -> Dict[str, Any]:
+    def analyze_pdf(file_path: str, open_pdf: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
         """
         Analyze PDF characteristics to determine optimal processing strategy
         Returns analysis result with processing recommendations
+        Results are memoized per file version; on a cache miss open_pdf, if
+        given, supplies an already opened pdfplumber handle (or None) so the
+        caller can reuse it afterwards
         """
         try:
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
-                has_text = False
-                has_images = False
-                estimated_scan_pages = []
-                
-                # Sample first few pages for analysis
-                sample_pages = min(5, total_pages)
-                
-                for i, page in enumerate(pdf.pages[:sample_pages]):
-                    text = page.extract_text()
-                    if text and text.strip():
-                        has_text = True
-                    
-                    # Check for images
-                    if page.images:
-                        has_images = True
-                    
-                    # Estimate if page is scanned (little/no extractable text)
-                    if not text or len(text.strip()) < 50:
-                        estimated_scan_pages.append(i)
-                
-                # Determine processing strategy
-                if not has_text and has_images:
-                    strategy = "ocr_heavy"
-                elif has_text and not has_images:
-                    strategy = "text_extraction"
-                else:
-                    strategy = "hybrid"
-                
-                file_size = Path(file_path).stat().st_size
-                
-                return {
-                    "pages": total_pages,
-                    "has_text": has_text,
-                    "has_images": has_images,
-                    "estimated_scan_pages": estimated_scan_pages,
-                    "file_size": file_size,
-                    "processing_strategy": strategy
-                }
+            stat = Path(file_path).stat()
+            key = (str(Path(file_path).resolve()), stat.st_mtime_ns, stat.st_size)
+            
+            cached = _analysis_cache.get(key)
+            if cached is not None:
+                _analysis_cache.move_to_end(key)
+                return dict(cached)
+            
+            pdf = open_pdf() if open_pdf is not None else None
+            if pdf is not None:
+                analysis = PDFAnalyzer._analyze_handle(pdf, stat.st_size)
+            else:
+                with _open_pdf_mmap(file_path) as opened:
+                    analysis = PDFAnalyzer._analyze_handle(opened, stat.st_size)
+            
+            _analysis_cache[key] = analysis
+            if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+            return dict(analysis)
                 
         except Exception as e:
             logging.error(f"PDF analysis failed: {e}")
@@ -96,17 +505,67 @@ class PDFAnalyzer:
                 "has_images": False,
                 "estimated_scan_pages": [0],
                 "file_size": 0,
-                "processing_strategy": "fallback"
+                "processing_strategy": "fallback",
+                "sampled_texts": {}
             }
+    
+    @staticmethod
+    def _analyze_handle(pdf, file_size: int) -> Dict[str, Any]:
+        """Sample pages of an open pdfplumber PDF"""
+        total_pages = len(pdf.pages)
+        
+        # Sample first few pages for analysis
+        sample_pages = pdf.pages[:min(5, total_pages)]
+        texts = [page.extract_text() or "" for page in sample_pages]
+        sampled_texts = dict(enumerate(texts))
+        
+        lengths = np.fromiter(
+            (len(text.strip()) for text in texts), dtype=np.int32, count=len(texts)
+        )
+        has_text, scan_idx = _classify_lengths(lengths)
+        
+        # Check for images
+        has_images = bool(np.array([bool(page.images) for page in sample_pages]).any())
+        
+        # Estimate if page is scanned (little/no extractable text)
+        estimated_scan_pages = scan_idx.tolist()
+        
+        # Determine processing strategy
+        if not has_text and has_images:
+            strategy = "ocr_heavy"
+        elif has_text and not has_images:
+            strategy = "text_extraction"
+        else:
+            strategy = "hybrid"
+        
+        return {
+            "pages": total_pages,
+            "has_text": has_text,
+            "has_images": has_images,
+            "estimated_scan_pages": estimated_scan_pages,
+            "file_size": file_size,
+            "processing_strategy": strategy,
+            "sampled_texts": sampled_texts
+        }
 
 
 class MultiEngineExtractor:
     """Main extraction class with multi-engine fallback"""
     
+    # Engine order per analysis strategy; strategies not listed use self.engines.
+    # Native text needs no layout models, so native engines go first for it.
+    # Scans try OCR first, but the strategy only reflects the sampled pages,
+    # so native engines stay in the chain as later fallbacks.
+    STRATEGY_ENGINE_ORDER = {
+        "text_extraction": ["pymupdf", "pdfplumber", "docling", "tesseract"],
+        "ocr_heavy": ["tesseract", "docling", "pymupdf", "pdfplumber"],
+    }
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.engines = [
             ("docling", self._docling_extract),
+            ("pymupdf", self._pymupdf_extract),
             ("pdfplumber", self._pdfplumber_extract),
             ("tesseract", self._tesseract_extract)
         ]
@@ -118,29 +577,94 @@ class MultiEngineExtractor:
         """
         start_time = time.time()
         
+        # Share one pdfplumber handle between analysis and the pdfplumber
+        # engine, opened only when one of them actually needs it
+        with ExitStack() as stack:
+            handles = []
+            
+            def get_handle():
+                if not handles:
+                    handles.append(self._open_pdfplumber(pdf_path, stack))
+                return handles[0]
+            
+            return self._extract_with_handle(pdf_path, get_handle, start_time)
+    
+    def _build_result(self, pdf_path: str, engine_name: str, result: Dict,
+                      status: str, start_time: float) -> ExtractionResult:
+        """Wrap an engine result in the standardized structure"""
+        content = result.get("content", {})
+        metadata = dict(result.get("metadata", {}))
+        
+        # Entities are optional metadata: a failed scan must not discard a
+        # valid extraction
+        try:
+            metadata["scanned_entities"] = _scan_entities(content.get("raw_text", ""))
+        except Exception as e:
+            self.logger.warning(f"Metadata scan failed for {pdf_path}: {e}")
+            metadata["scanned_entities"] = []
+        
+        processing_time = time.time() - start_time
+        
+        return ExtractionResult(
+            extraction_info={
+                "file_name": Path(pdf_path).name,
+                "processing_time": f"{processing_time:.2f}s",
+                "engine_used": [engine_name],
+                "status": status,
+                "confidence": result.get("confidence", 0.8)
+            },
+            content=content,
+            metadata=metadata
+        )
+    
+    def _order_engines(self, strategy: Optional[str]) -> List[Tuple[str, Callable]]:
+        """
+        Engines to try for a document, specialized by processing strategy
+        Reorders but never drops engines: any not named for the strategy are
+        appended in their default order
+        """
+        order = self.STRATEGY_ENGINE_ORDER.get(strategy)
+        if order is None:
+            return self.engines
+        
+        engines = dict(self.engines)
+        ordered = [(name, engines[name]) for name in order if name in engines]
+        ordered += [(name, engine) for name, engine in self.engines if name not in order]
+        return ordered
+    
+    def _open_pdfplumber(self, pdf_path: str, stack: ExitStack):
+        """
+        Open an mmap-backed pdfplumber handle that closes with stack
+        Returns None if pdfplumber cannot read the file
+        """
+        try:
+            return stack.enter_context(_open_pdf_mmap(pdf_path))
+        except Exception as e:
+            self.logger.warning(f"pdfplumber could not open {pdf_path}: {e}")
+            return None
+    
+    def _extract_with_handle(self, pdf_path: str, get_handle: Callable[[], Any],
+                             start_time: float) -> ExtractionResult:
+        """Run analysis and the engine chain, opening the shared handle lazily"""
         # Step 1: Analyze PDF
-        analysis = PDFAnalyzer.analyze_pdf(pdf_path)
+        analysis = PDFAnalyzer.analyze_pdf(pdf_path, open_pdf=get_handle)
         
         # Step 2: Try extraction engines in order
-        for engine_name, extractor in self.engines:
+        ordered_engines = self._order_engines(analysis.get("processing_strategy"))
+        self.logger.debug(
+            f"Engine order for {pdf_path}: {[name for name, _ in ordered_engines]}"
+        )
+        
+        for engine_name, extractor in ordered_engines:
             try:
                 self.logger.info(f"Trying {engine_name} extraction for {pdf_path}")
-                result = extractor(pdf_path, analysis)
+                if engine_name == "pdfplumber":
+                    result = extractor(pdf_path, analysis, pdf_handle=get_handle())
+                else:
+                    result = extractor(pdf_path, analysis)
                 
                 if self._is_valid_result(result):
-                    processing_time = time.time() - start_time
-                    
-                    return ExtractionResult(
-                        extraction_info={
-                            "file_name": Path(pdf_path).name,
-                            "processing_time": f"{processing_time:.2f}s",
-                            "engine_used": [engine_name],
-                            "status": "success",
-                            "confidence": result.get("confidence", 0.8)
-                        },
-                        content=result.get("content", {}),
-                        metadata=result.get("metadata", {})
-                    )
+                    return self._build_result(pdf_path, engine_name, result, "success", start_time)
                     
             except Exception as e:
                 self.logger.error(f"{engine_name} extraction failed: {e}")
@@ -172,16 +696,20 @@ class MultiEngineExtractor:
     
     def _docling_extract(self, pdf_path: str, analysis: Dict) -> Dict[str, Any]:
         """Extract using docling engine"""
-        if not DOCLING_AVAILABLE:
-            raise ImportError("docling not available")
+        converter = _get_converter()
+        document = converter.convert(pdf_path).document
         
-        converter = DocumentConverter()
-        result = converter.convert(pdf_path)
+        # Only serialize when the document has some text; an empty conversion
+        # then falls through to the next engine without a full export
+        if self._docling_has_text(document):
+            raw_text = document.export_to_text()
+        else:
+            raw_text = ""
         
         # Convert docling result to standardized format
         return {
             "content": {
-                "raw_text": result.document.export_to_text(),
+                "raw_text": raw_text,
                 "pages": [],  # TODO: Extract page-by-page content
                 "tables": [],  # TODO: Extract tables
                 "images": []   # TODO: Extract images
@@ -193,33 +721,36 @@ class MultiEngineExtractor:
             "confidence": 0.9
         }
     
-    def _pdfplumber_extract(self, pdf_path: str, analysis: Dict) -> Dict[str, Any]:
-        """Extract using pdfplumber engine"""
-        with pdfplumber.open(pdf_path) as pdf:
-            pages_content = []
+    @staticmethod
+    def _docling_has_text(document) -> bool:
+        """Probe docling text items, stopping at the first non-empty one"""
+        text_items = getattr(document, "texts", None)
+        if text_items is None:
+            # Older document model without text items: assume text is present
+            return True
+        return any((getattr(item, "text", "") or "").strip() for item in text_items)
+    
+    def _pymupdf_extract(self, pdf_path: str, analysis: Dict) -> Dict[str, Any]:
+        """Extract using PyMuPDF engine (native MuPDF, fast path)"""
+        fitz = _get_pymupdf()
+        with fitz.open(pdf_path) as doc:
+            pages_content: List[PageContent] = []
             tables = []
-            raw_text = ""
+            page_texts: List[str] = []
             
-            for i, page in enumerate(pdf.pages):
-                page_text = page.extract_text() or ""
-                raw_text += page_text + "\n"
+            for i, page in enumerate(doc):
+                page_text = page.get_text("text")
+                page_texts.append(page_text)
                 
-                pages_content.append({
-                    "page_num": i + 1,
-                    "text": page_text,
-                    "tables": [],
-                    "images": []
-                })
+                pages_content.append(PageContent(page_num=i + 1, text=page_text))
                 
-                # Extract tables
-                page_tables = page.extract_tables()
-                if page_tables:
-                    for j, table in enumerate(page_tables):
-                        tables.append({
-                            "page": i + 1,
-                            "table_id": j,
-                            "data": table
-                        })
+                # Table detection requires PyMuPDF 1.23+
+                if hasattr(page, "find_tables"):
+                    for j, table in enumerate(page.find_tables().tables):
+                        tables.append(TableContent.from_rows(i + 1, j, table.extract()))
+            
+            # Join once instead of repeated += (quadratic in total text size)
+            raw_text = "\n".join(page_texts) + "\n" if page_texts else ""
             
             return {
                 "content": {
@@ -229,30 +760,153 @@ class MultiEngineExtractor:
                     "images": []
                 },
                 "metadata": {
-                    "total_pages": len(pdf.pages),
+                    "total_pages": doc.page_count,
                     "text_extraction_method": "native"
                 },
-                "confidence": 0.8 if raw_text.strip() else 0.3
+                "confidence": 0.85 if raw_text.strip() else 0.3
             }
     
+    def _pdfplumber_extract(self, pdf_path: str, analysis: Dict, pdf_handle=None) -> Dict[str, Any]:
+        """
+        Extract using pdfplumber engine
+        pdf_handle: already opened pdfplumber PDF to reuse (left open)
+        """
+        pages_content: List[PageContent] = []
+        tables = []
+        page_texts: List[str] = []
+        
+        for page_result in self._pdfplumber_extract_stream(pdf_path, analysis, pdf_handle):
+            page_texts.append(page_result["text"])
+            pages_content.append(_page_record(page_result))
+            tables.extend(_table_records(page_result))
+        
+        return _pdfplumber_result(page_texts, tables, pages_content)
+    
+    def _pdfplumber_extract_stream(self, pdf_path: str, analysis: Dict,
+                                   pdf_handle=None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield pdfplumber page results in page order as they are extracted
+        pdf_handle: already opened pdfplumber PDF to reuse (left open)
+        """
+        if pdf_handle is not None:
+            pdf_context = nullcontext(pdf_handle)
+        else:
+            pdf_context = _get_pdfplumber().open(pdf_path)
+        
+        # Pages sampled during analysis don't need their text extracted again
+        sampled_texts = analysis.get("sampled_texts", {})
+        
+        with pdf_context as pdf:
+            total_pages = len(pdf.pages)
+            workers = _get_max_workers()
+            parallel = workers > 1 and total_pages >= MIN_PAGES_FOR_PARALLEL
+            
+            if not parallel:
+                yield from _extract_pages(enumerate(pdf.pages), sampled_texts)
+                return
+        
+        # Pages are independent, so fan blocks of them out to worker processes
+        tasks = [
+            (pdf_path, chunk, {i: sampled_texts[i] for i in chunk if i in sampled_texts})
+            for chunk in _chunk_pages(total_pages, workers)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() preserves chunk order, and so page order
+            for chunk_results in executor.map(_extract_chunk, tasks):
+                yield from chunk_results
+    
+    def extract_stream(self, pdf_path: str, json_out: Path) -> Dict[str, Any]:
+        """
+        Extract with pdfplumber, writing each page to json_out as it is done
+        The file has the same structure as save_extraction_results' JSON, but
+        per-page records are never held in memory together; the returned
+        result therefore has an empty content["pages"]. Documents without
+        native text go through the full engine chain instead
+        """
+        start_time = time.time()
+        analysis = PDFAnalyzer.analyze_pdf(pdf_path)
+        
+        try:
+            result = self._write_pdfplumber_stream(pdf_path, analysis, json_out, start_time)
+            if result is not None:
+                return result
+        except Exception as e:
+            self.logger.error(f"pdfplumber streaming failed for {pdf_path}: {e}")
+        
+        # Never fail: replace the partial file with the regular pipeline result
+        result_dict = _result_to_dict(self.extract(pdf_path))
+        _write_json(json_out, result_dict)
+        return result_dict
+    
+    def _write_pdfplumber_stream(self, pdf_path: str, analysis: Dict, json_out: Path,
+                                 start_time: float) -> Optional[Dict[str, Any]]:
+        """Stream pdfplumber pages into json_out; None if no usable text was found"""
+        tables = []
+        page_texts: List[str] = []
+        
+        with open(json_out, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{"content":{"pages":[')
+            for n, page_result in enumerate(self._pdfplumber_extract_stream(pdf_path, analysis)):
+                if n:
+                    f.write(b',')
+                f.write(_dumps_json(_page_record(page_result), indent=False))
+                page_texts.append(page_result["text"])
+                tables.extend(_table_records(page_result))
+            
+            # Page records are already on disk, so none are kept in the result
+            engine_result = _pdfplumber_result(page_texts, tables, [])
+            raw_text = engine_result["content"]["raw_text"]
+            if not self._is_valid_result(engine_result):
+                return None
+            
+            result = self._build_result(pdf_path, "pdfplumber", engine_result, "success", start_time)
+            f.write(b'],"raw_text":' + _dumps_json(raw_text, indent=False))
+            f.write(b',"tables":' + _dumps_json(tables, indent=False))
+            f.write(b',"images":[]},"extraction_info":')
+            f.write(_dumps_json(result.extraction_info, indent=False))
+            f.write(b',"metadata":' + _dumps_json(result.metadata, indent=False) + b'}')
+        
+        return _result_to_dict(result)
+    
     def _tesseract_extract(self, pdf_path: str, analysis: Dict) -> Dict[str, Any]:
         """Extract using OCR (last resort)"""
-        if not TESSERACT_AVAILABLE:
-            raise ImportError("pytesseract not available")
+        _get_pytesseract()
+        pdfium = _get_pdfium()
+        
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            total_pages = len(pdf)
+        finally:
+            pdf.close()
         
-        # Convert PDF to images and OCR each page
-        # This is a simplified implementation
-        raw_text = "OCR extraction placeholder - implementation needed"
+        # Rendering and OCR are CPU-bound per page, so blocks of pages go to
+        # worker processes the same way as pdfplumber extraction
+        workers = _get_max_workers()
+        chunks = _chunk_pages(total_pages, workers)
+        if workers > 1 and total_pages >= MIN_PAGES_FOR_PARALLEL:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                tasks = [(pdf_path, chunk) for chunk in chunks]
+                chunk_results = list(executor.map(_ocr_block, tasks))
+        else:
+            chunk_results = [_ocr_block((pdf_path, chunk)) for chunk in chunks]
+        
+        pages_content: List[PageContent] = []
+        page_texts: List[str] = []
+        for page_result in (result for chunk in chunk_results for result in chunk):
+            page_texts.append(page_result["text"])
+            pages_content.append(_page_record(page_result))
+        
+        raw_text = "\n".join(page_texts) + "\n" if page_texts else ""
         
         return {
             "content": {
                 "raw_text": raw_text,
-                "pages": [],
+                "pages": pages_content,
                 "tables": [],
                 "images": []
             },
             "metadata": {
-                "total_pages": analysis.get("pages", 0),
+                "total_pages": total_pages,
                 "text_extraction_method": "ocr"
             },
             "confidence": 0.6
@@ -278,12 +932,56 @@ def extract_pdf(pdf_path: str) -> Dict[str, Any]:
     extractor = MultiEngineExtractor()
     result = extractor.extract(pdf_path)
     
-    # Convert to dictionary for JSON serialization
-    return {
-        "extraction_info": result.extraction_info,
-        "content": result.content,
-        "metadata": result.metadata
-    }
+    return _result_to_dict(result)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize result records (PageContent, TableContent) via to_dict()"""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON (indented by default), using orjson when available"""
+    if HAS_ORJSON:
+        # Route dataclasses through to_dict() rather than their raw fields
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+# Output files are written through a buffer of one 4 KiB memory page;
+# extracted text, which can run to several MiB, gets a 1 MiB buffer
+WRITE_BUFFER_SIZE = 4096
+TXT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _write_json(path: Path, result: Dict[str, Any]) -> None:
+    """Write the full extraction result as JSON"""
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_dumps_json(result))
+
+
+def _write_txt(path: Path, result: Dict[str, Any]) -> None:
+    """Write the extracted raw text, encoded once and written in one call"""
+    raw = result['content']['raw_text'].encode('utf-8')
+    with open(path, 'wb', buffering=TXT_WRITE_BUFFER_SIZE) as f:
+        f.write(raw)
+
+
+def extract_pdf_stream(pdf_path: str, json_out: Path) -> Dict[str, Any]:
+    """
+    Streaming variant of extract_pdf for large PDFs
+    Pages are written to json_out as they are extracted instead of being
+    collected first; the returned result leaves content["pages"] empty
+    """
+    extractor = MultiEngineExtractor()
+    return extractor.extract_stream(pdf_path, Path(json_out))
 
 
 def save_extraction_results(pdf_path: str, result: Dict[str, Any]) -> Tuple[str, str]:
@@ -302,13 +1000,14 @@ def save_extraction_results(pdf_path: str, result: Dict[str, Any]) -> Tuple[str,
     json_output = output_dir / f"{base_name}.json"
     txt_output = output_dir / f"{base_name}.txt"
     
-    # Save as JSON file
-    with open(json_output, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
-    
-    # Save raw text as TXT file
-    with open(txt_output, 'w', encoding='utf-8') as f:
-        f.write(result['content']['raw_text'])
+    # Save JSON and TXT files concurrently (file writes release the GIL)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_write_json, json_output, result),
+            executor.submit(_write_txt, txt_output, result)
+        ]
+        for future in futures:
+            future.result()
     
     return str(json_output), str(txt_output)
 
@@ -335,4 +1034,4 @@ if __name__ == "__main__":
     print(f"Text output saved to: {txt_path}")
     
     # Print result as JSON to console
-    print(json.dumps(result, indent=2, ensure_ascii=False))
\ No newline at end of file
+    print(_dumps_json(result).decode('utf-8'))
\ No newline at end of file